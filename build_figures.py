@@ -0,0 +1,47 @@
+"""
+Prebuilds the survey dashboard figure as static JSON (figs/dashboard.json), so
+the Streamlit page can serve it without any pandas or Plotly work.
+
+Run it whenever the survey CSV changes:
+
+    python build_figures.py
+
+The figure is only rewritten when the parsed data or SCHEMA_VERSION differ
+from the ones it was built from; pass --force after changing the chart code.
+The page serves it only while its URL, schema version and data still match
+what load_data returns.
+Pass --csv to build from a local copy of the CSV (e.g. the one checked in
+here) instead of downloading DATA_URL.
+"""
+import argparse
+import json
+from pathlib import Path
+
+from charts import FIGURE_PATH, build_dashboard_figure
+from data import CATEGORICAL_COLS, DATA_URL, SCHEMA_VERSION, counts, data_fingerprint, fetch_csv_bytes, parse_csv
+
+def main():
+    parser = argparse.ArgumentParser(description="Prebuild the survey dashboard figure.")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the CSV is unchanged")
+    parser.add_argument("--csv", type=Path, help="local copy of the CSV at DATA_URL")
+    args = parser.parse_args()
+
+    raw = args.csv.read_bytes() if args.csv else fetch_csv_bytes(DATA_URL)
+    # Parsed straight from the fetched bytes, not the local Parquet snapshot,
+    # so the figure always reflects the current CSV
+    arts_df = parse_csv(raw)
+    meta = {"url": DATA_URL, "schema_version": SCHEMA_VERSION, "data_sha256": data_fingerprint(arts_df)}
+    if FIGURE_PATH.exists() and not args.force:
+        built = json.loads(FIGURE_PATH.read_text()).get("layout", {}).get("meta")
+        if built == meta:
+            print(f"{FIGURE_PATH} is up to date")
+            return
+
+    fig = build_dashboard_figure({col: counts(arts_df, col) for col in CATEGORICAL_COLS})
+    fig.update_layout(meta=meta)
+    FIGURE_PATH.parent.mkdir(exist_ok=True)
+    FIGURE_PATH.write_text(fig.to_json())
+    print(f"Wrote {FIGURE_PATH}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Prebuilt dashboard figure written by build_figures.py
+FIGURE_PATH = Path(__file__).parent / "figs" / "dashboard.json"
+
+# --- Chart Specifications ---
+# Each entry describes one visualization; the charts are laid out as subplots
+# two per row in the order listed.
+CHART_SPECS = [
+    {
+        "key": "program",
+        "col": "Arts Program",
+        "kind": "bar_h",
+        "subheader": "1. Distribution of Arts Programs",
+        "title": "Distribution of Arts Programs",
+        "label": "Program",
+    },
+    {
+        "key": "year",
+        "col": "Bachelor Academic Year in EU",
+        "kind": "bar",
+        "subheader": "2. Academic Year Distribution",
+        "title": "Distribution of Academic Years in Arts Faculty",
+        "label": "Academic Year",
+    },
+    {
+        "key": "medium",
+        "col": "H.S.C or Equivalent study medium",
+        "kind": "bar",
+        "subheader": "3. HSC Study Medium Distribution",
+        "title": "Distribution of HSC Study Medium",
+        "label": "Study Medium",
+        "tilt_labels": True,
+    },
+    {
+        "key": "coaching",
+        "col": "Did you ever attend a Coaching center?",
+        "kind": "pie",
+        "subheader": "4. Coaching Center Attendance",
+        "title": "Did students attend a Coaching Center?",
+        "label": "Attended Coaching Center",
+        "hole": .3,
+    },
+    {
+        "key": "modality",
+        "col": "Classes are mostly",
+        "kind": "bar",
+        "subheader": "5. Class Modality Distribution",
+        "title": "Distribution of Class Modality",
+        "label": "Class Modality",
+        "tilt_labels": True,
+    },
+    {
+        "key": "gender_pie",
+        "col": "Gender",
+        "kind": "pie",
+        "subheader": "6. Gender Distribution (Pie Chart)",
+        "title": "Gender Distribution in Arts Faculty",
+        "label": "Gender",
+        "hole": .4,
+    },
+    {
+        "key": "gender_bar",
+        "col": "Gender",
+        "kind": "bar",
+        "subheader": "7. Gender Distribution (Bar Chart)",
+        "title": "Gender Distribution in Arts Faculty",
+        "label": "Gender",
+    },
+]
+
+# --- Chart Rendering ---
+def build_bar_trace(counts_df, spec):
+    """
+    Builds a bar trace from a precomputed counts DataFrame.
+    """
+    import plotly.graph_objects as go
+    from plotly.colors import qualitative
+
+    # Plain NumPy arrays let Plotly ship the data as base64 typed arrays
+    # instead of JSON lists; int32 is one of the supported dtypes. Bars follow
+    # the counts frame, which counts() already sorted descending.
+    categories = counts_df[spec["col"]].to_numpy()
+    values = counts_df['Count'].to_numpy(dtype=np.int32)
+    # One trace with per-bar colours from the palette, cycled if needed
+    palette = qualitative.Plotly
+    colors = [palette[i % len(palette)] for i in range(len(values))]
+    # Bar panels are read-only like a static image: counts are printed on the
+    # bars and hover is skipped, leaving Plotly.js no hover work for them
+    style = dict(name='Count', marker_color=colors, text=values, textposition='auto', hoverinfo='skip')
+    if spec["kind"] == "bar_h":
+        return go.Bar(x=values, y=categories, orientation='h', **style)
+    return go.Bar(x=categories, y=values, **style)
+
+def build_pie_trace(counts_df, spec):
+    """
+    Builds a donut trace from a precomputed counts DataFrame.
+    """
+    import plotly.graph_objects as go
+
+    names = counts_df[spec["col"]].to_numpy()
+    values = counts_df['Count'].to_numpy(dtype=np.int32)
+    # Slice labels are formatted here so Plotly.js does not rebuild them
+    shares = values / values.sum()
+    text = [f"{name}<br>{share:.1%}" for name, share in zip(names, shares)]
+    return go.Pie(
+        values=values,
+        labels=names,
+        hole=spec["hole"],
+        text=text,
+        textinfo='text',
+        textposition='inside',
+        # Hover names the field instead of repeating the slice text
+        hovertemplate=f"{spec['label']}: %{{label}}<br>Count: %{{value}}<br>%{{percent}}<extra></extra>"
+    )
+
+def build_dashboard_figure(aggregates) -> "go.Figure":
+    """
+    Builds one figure holding every chart as a subplot, two per row in spec
+    order, so the browser mounts a single Plotly figure with a shared layout.
+    aggregates maps each plotted column to its counts DataFrame.
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    rows = (len(CHART_SPECS) + 1) // 2
+    grid = [[None, None] for _ in range(rows)]
+    for i, spec in enumerate(CHART_SPECS):
+        grid[i // 2][i % 2] = {"type": "domain" if spec["kind"] == "pie" else "xy"}
+    fig = make_subplots(
+        rows=rows,
+        cols=2,
+        specs=grid,
+        subplot_titles=[spec["title"] for spec in CHART_SPECS],
+        vertical_spacing=0.08,
+        # Passed in, so the subplots are laid out on this template from the
+        # start, without touching the process-wide default
+        figure=go.Figure(layout={'template': 'plotly_white'})
+    )
+
+    for i, spec in enumerate(CHART_SPECS):
+        row, col = i // 2 + 1, i % 2 + 1
+        counts_df = aggregates[spec["col"]]
+        if spec["kind"] == "pie":
+            fig.add_trace(build_pie_trace(counts_df, spec), row=row, col=col)
+            continue
+        fig.add_trace(build_bar_trace(counts_df, spec), row=row, col=col)
+        if spec["kind"] == "bar_h":
+            fig.update_yaxes(title=spec["label"], row=row, col=col)
+            fig.update_xaxes(title='Count', row=row, col=col)
+        else:
+            fig.update_xaxes(title=spec["label"], tickangle=45 if spec.get("tilt_labels") else None, row=row, col=col)
+            fig.update_yaxes(title='Count', row=row, col=col)
+
+    # No zoom or pan on the bar panels; only the pies stay interactive
+    fig.update_xaxes(fixedrange=True)
+    fig.update_yaxes(fixedrange=True)
+    fig.update_layout(showlegend=False, height=450 * rows, dragmode=False)
+    return fig
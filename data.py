@@ -0,0 +1,127 @@
+import hashlib
+import io
+from pathlib import Path
+from urllib.request import urlopen
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+DATA_URL = 'https://raw.githubusercontent.com/aleya566/EC2024/refs/heads/main/arts_faculty_data.csv'
+# Bump when load_data changes the shape of the parsed data, so stale
+# snapshots and cached figures are not reused
+SCHEMA_VERSION = 4
+# Local snapshot of the parsed data, so cold starts skip the network fetch
+LOCAL_PATH = Path.home() / ".streamlit" / "cache" / f"arts_faculty_data.v{SCHEMA_VERSION}.parquet"
+
+# CSV headers of the plotted columns, mapped to the names the dashboard uses
+# (the export double-spaces the academic-year header). Only these columns are
+# read, and they are parsed straight into pandas Categoricals.
+CSV_COLUMNS = {
+    "Arts Program": "Arts Program",
+    "Bachelor  Academic Year in EU": "Bachelor Academic Year in EU",
+    "H.S.C or Equivalent study medium": "H.S.C or Equivalent study medium",
+    "Did you ever attend a Coaching center?": "Did you ever attend a Coaching center?",
+    "Classes are mostly": "Classes are mostly",
+    "Gender": "Gender",
+}
+CATEGORICAL_COLS = list(CSV_COLUMNS.values())
+
+# --- Data Loading ---
+@st.cache_resource(show_spinner=False)
+def fetch_csv_bytes(url: str) -> bytes:
+    """
+    Downloads the raw CSV once per process, so a st.cache_data miss re-parses
+    from memory instead of going back over HTTP.
+    """
+    with urlopen(url, timeout=30) as response:
+        return response.read()
+
+def parse_csv(raw: bytes) -> pd.DataFrame:
+    """
+    Parses the raw survey CSV into the plotted columns, as Categoricals, with
+    blank answers as missing values.
+    """
+    arts_df = pd.read_csv(
+        io.BytesIO(raw),
+        engine='pyarrow',
+        dtype_backend='pyarrow',
+        usecols=list(CSV_COLUMNS),
+        dtype={c: "category" for c in CSV_COLUMNS},
+    )
+    # pandas 2.0 reads empty cells into these columns as "" rather than NA,
+    # which would add a blank category to every chart
+    for col in CSV_COLUMNS:
+        if "" in arts_df[col].cat.categories:
+            arts_df[col] = arts_df[col].cat.remove_categories([""])
+    return arts_df.rename(columns=CSV_COLUMNS)
+
+@st.cache_resource(show_spinner=False)
+def load_data(url: str = DATA_URL) -> pd.DataFrame:
+    """
+    Loads data from the local Parquet snapshot, or from the URL on first run,
+    and handles potential errors.
+    The frame is shared across sessions rather than copied on every cache hit,
+    so callers must treat it as read-only.
+    """
+    try:
+        try:
+            return pd.read_parquet(LOCAL_PATH)
+        except FileNotFoundError:
+            pass
+        arts_df = parse_csv(fetch_csv_bytes(url))
+        try:
+            LOCAL_PATH.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so a crash mid-write never leaves a truncated
+            # snapshot for the next cold start to trip over
+            partial = LOCAL_PATH.with_suffix(".partial")
+            arts_df.to_parquet(partial, compression='zstd')
+            partial.replace(LOCAL_PATH)
+        except OSError:
+            # A read-only home directory just means no snapshot
+            pass
+        return arts_df
+    except Exception as e:
+        st.error(f"An error occurred while loading data: {e}")
+        return pd.DataFrame()
+
+def counts(arts_df: pd.DataFrame, col: str) -> pd.DataFrame:
+    """
+    Returns a two-column DataFrame of category counts for the given column.
+    """
+    # A bincount over the categorical codes; code -1 marks a blank answer,
+    # which is left out of the charts
+    categories = arts_df[col].cat.categories.to_numpy()
+    codes = arts_df[col].cat.codes.to_numpy()
+    tally = np.bincount(codes[codes >= 0], minlength=len(categories))
+    order = np.argsort(-tally, kind='stable')
+    # Built straight from arrays; the int32 counts reach Plotly without another
+    # dtype conversion
+    return pd.DataFrame({col: categories[order], 'Count': tally[order].astype(np.int32)})
+
+def data_fingerprint(arts_df: pd.DataFrame) -> str:
+    """
+    Returns a SHA-256 of the parsed values, the same whether the frame came
+    from the CSV or the Parquet snapshot, so a prebuilt figure can be matched
+    to the data it was built from.
+    """
+    hashes = pd.util.hash_pandas_object(arts_df, index=False).to_numpy()
+    return hashlib.sha256(hashes.tobytes()).hexdigest()
+
+@st.cache_data
+def compute_aggregates(df_hash_key: str) -> dict[str, pd.DataFrame]:
+    """
+    Returns the counts DataFrame of every plotted column, keyed by column name.
+    The data URL doubles as the cache key, so reruns skip the aggregation.
+    """
+    arts_df = load_data(df_hash_key)
+    return {col: counts(arts_df, col) for col in CATEGORICAL_COLS}
+
+@st.cache_resource
+def preview_table(df_hash_key: str) -> pa.Table:
+    """
+    Returns the first rows of the data as an Arrow table for st.dataframe.
+    Cached as a resource, so reruns skip the pandas-to-Arrow conversion.
+    """
+    return pa.Table.from_pandas(load_data(df_hash_key).head(), preserve_index=False)